@@ -9,6 +9,8 @@ from fastapi import FastAPI
 
 logger = structlog.get_logger(__name__)
 
+_MISSING = object()
+
 
 def load_custom_app(app_import: str, base_dir: Path | None = None) -> FastAPI | None:
     """Load custom FastAPI app from import path.
@@ -41,10 +43,10 @@ def load_custom_app(app_import: str, base_dir: Path | None = None) -> FastAPI |
 
     try:
         # Determine if it's a file path or module path
-        path_obj = Path(path)
-        is_file_path = path_obj.suffix == ".py" or path.startswith("./") or path.startswith("../")
+        is_file_path = path.endswith(".py") or path.startswith(("./", "../"))
 
         if is_file_path:
+            path_obj = Path(path)
             # Resolve relative paths from base_dir if provided
             if not path_obj.is_absolute() and base_dir is not None:
                 path_obj = (base_dir / path_obj).resolve()
@@ -64,13 +66,10 @@ def load_custom_app(app_import: str, base_dir: Path | None = None) -> FastAPI |
             module = importlib.import_module(path)
 
         # Get the app instance from the module
-        if not hasattr(module, name):
-            raise AttributeError(
-                f"App '{name}' not found in module '{path}'. "
-                f"Available attributes: {[attr for attr in dir(module) if not attr.startswith('_')]}"
-            )
-
-        user_app = getattr(module, name)
+        user_app = getattr(module, name, _MISSING)
+        if user_app is _MISSING:
+            available = [attr for attr in dir(module) if not attr.startswith("_")]
+            raise AttributeError(f"App '{name}' not found in module '{path}'. Available attributes: {available}")
 
         # Validate it's a FastAPI application
         if not isinstance(user_app, FastAPI):
@@ -7,6 +7,9 @@ from fastapi import Depends, HTTPException, Request
 from aegra_api.core.auth_middleware import get_auth_backend
 from aegra_api.models.auth import User
 
+_PERMISSION_SET_SCOPE_KEY = "aegra_permission_set"
+_USER_MODEL_SCOPE_KEY = "aegra_user_model"
+
 
 def _extract_user_data(user_obj: Any) -> dict[str, Any]:
     """Extract user data from various object types.
@@ -44,17 +47,60 @@ def _to_user_model(user: Any) -> User:
     user_data = _extract_user_data(user)
 
     # Ensure identity exists
-    if "identity" not in user_data:
+    identity = user_data.get("identity")
+    if identity is None:
         raise HTTPException(status_code=401, detail="User identity not provided")
 
-    # Set display_name default if not provided
-    if user_data.get("display_name") is None:
-        user_data["display_name"] = user_data["identity"]
+    # Coerce the fields handlers most often return with the wrong type (e.g. a UUID
+    # identity) so the common case can skip validation; permissions match authenticate().
+    if not isinstance(identity, str):
+        user_data["identity"] = identity = str(identity)
+
+    display_name = user_data.get("display_name")
+    if display_name is None:
+        user_data["display_name"] = identity
+    elif not isinstance(display_name, str):
+        user_data["display_name"] = str(display_name)
+
+    permissions = user_data.get("permissions")
+    if isinstance(permissions, str):
+        user_data["permissions"] = [permissions]
+    elif permissions is not None and not isinstance(permissions, list):
+        user_data["permissions"] = list(permissions)
 
     # Pass all fields through to User model (extra fields allowed via ConfigDict)
+    if _has_declared_field_types(user_data):
+        return User.model_construct(**user_data)
+    # Validation coerces values like is_authenticated="false" or rejects them outright
     return User(**user_data)
 
 
+def _has_declared_field_types(user_data: dict[str, Any]) -> bool:
+    """Return True if every declared User field in user_data already has its annotated type."""
+    permissions = user_data.get("permissions", [])
+    return (
+        type(user_data.get("is_authenticated", True)) is bool
+        and isinstance(user_data.get("org_id"), str | None)
+        and isinstance(user_data.get("email"), str | None)
+        and isinstance(permissions, list)
+        and all(type(permission) is str for permission in permissions)
+    )
+
+
+def _request_user_model(request: Request, user: Any) -> User:
+    """Convert ``user`` once per request, reusing the result for repeat lookups.
+
+    The cached model is keyed on the identity of the raw auth object, so a
+    different object in scope always triggers a fresh conversion.
+    """
+    cached = request.scope.get(_USER_MODEL_SCOPE_KEY)
+    if cached is not None and cached[0] is user:
+        return cached[1]
+    user_model = _to_user_model(user)
+    request.scope[_USER_MODEL_SCOPE_KEY] = (user, user_model)
+    return user_model
+
+
 async def require_auth(request: Request) -> User:
     """FastAPI dependency for authentication.
 
@@ -84,16 +130,13 @@ async def require_auth(request: Request) -> User:
 
     credentials, user = result
 
-    # Set request.scope for backward compatibility
-    # (Some code might still read request.scope["user"] or request.user)
+    # Set request.scope for backward compatibility; Starlette's request.user
+    # and request.auth read straight from these keys.
     request.scope["user"] = user
     request.scope["auth"] = credentials
-    # Also set request.user for Starlette compatibility
-    if not hasattr(request, "user"):
-        request.user = user
 
     # Convert to User model
-    return _to_user_model(user)
+    return _request_user_model(request, user)
 
 
 # Type alias for cleaner route signatures
@@ -126,17 +169,20 @@ def get_current_user(request: Request) -> User:
     """
     # Try reading from request.scope first (set by require_auth dependency)
     user = request.scope.get("user")
+    # Already-converted User models need no re-extraction; exact class compare skips the MRO walk
+    if user.__class__ is User and user.is_authenticated:
+        return user
     if user is None:
         # Fallback to request.user (set by middleware)
         if not hasattr(request, "user") or request.user is None:
             raise HTTPException(status_code=401, detail="Authentication required")
         user = request.user
 
-    if hasattr(user, "is_authenticated") and not user.is_authenticated:
+    if not getattr(user, "is_authenticated", True):
         raise HTTPException(status_code=401, detail="Invalid authentication")
 
     # Convert to User model
-    return _to_user_model(user)
+    return _request_user_model(request, user)
 
 
 def get_user_id(user: User = Depends(get_current_user)) -> str:
@@ -168,8 +214,13 @@ def require_permission(permission: str):
             return {"message": "Admin access granted"}
     """
 
-    def permission_dependency(user: User = Depends(get_current_user)) -> User:
-        if permission not in user.permissions:
+    def permission_dependency(request: Request, user: User = Depends(get_current_user)) -> User:
+        # Stacked permission checks on one request share a single frozenset of the user's permissions
+        permission_set = request.scope.get(_PERMISSION_SET_SCOPE_KEY)
+        if permission_set is None:
+            permission_set = frozenset(user.permissions)
+            request.scope[_PERMISSION_SET_SCOPE_KEY] = permission_set
+        if permission not in permission_set:
             raise HTTPException(status_code=403, detail=f"Permission '{permission}' required")
         return user
 
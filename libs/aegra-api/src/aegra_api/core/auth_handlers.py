@@ -14,6 +14,8 @@ from langgraph_sdk.auth.types import AuthContext as LangGraphAuthContext
 from aegra_api.core.auth_middleware import get_auth_instance
 from aegra_api.models.auth import User
 
+_GLOBAL_HANDLER_KEY: tuple[str, str] = ("*", "*")
+
 
 class AuthContextWrapper:
     """Wrapper to convert Aegra User model to AuthContext.
@@ -23,6 +25,8 @@ class AuthContextWrapper:
     so we can use it directly after ensuring compatibility.
     """
 
+    __slots__ = ("user", "resource", "action", "permissions")
+
     def __init__(
         self,
         user: User,
@@ -181,22 +185,24 @@ def _get_handler(
     """
     # Check cache first
     key = (resource, action)
-    if key in auth._handler_cache:
-        return auth._handler_cache[key]
+    handler = auth._handler_cache.get(key)
+    if handler is not None:
+        return handler
 
     # Priority order (most specific first)
-    keys = [
-        (resource, action),  # Most specific: exact resource+action
+    keys = (
+        key,  # Most specific: exact resource+action
         (resource, "*"),  # Resource-specific: all actions on resource
         ("*", action),  # Action-specific: all resources for action
-        ("*", "*"),  # Global: all resources and actions
-    ]
+        _GLOBAL_HANDLER_KEY,  # Global: all resources and actions
+    )
 
     # Find first matching handler
     for check_key in keys:
-        if check_key in auth._handlers and auth._handlers[check_key]:
+        handlers = auth._handlers.get(check_key)
+        if handlers:
             # Get the last registered handler (most recent wins)
-            handler = auth._handlers[check_key][-1]
+            handler = handlers[-1]
             # Cache the result
             auth._handler_cache[key] = handler
             return handler
@@ -5,10 +5,11 @@ This module integrates authentication system with FastAPI
 using Starlette's AuthenticationMiddleware.
 """
 
-import functools
 import importlib
 import importlib.util
 import sys
+import threading
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +22,7 @@ from starlette.authentication import (
     AuthenticationError,
     BaseUser,
 )
+from starlette.datastructures import Headers
 from starlette.requests import HTTPConnection
 from starlette.responses import JSONResponse
 
@@ -30,6 +32,19 @@ from aegra_api.settings import settings
 
 logger = structlog.getLogger(__name__)
 
+_MISSING = object()
+
+
+def _headers_to_dict(headers: Mapping[Any, Any]) -> dict[str, str]:
+    """Convert connection headers to the plain str dict auth handlers expect."""
+    # Starlette already decodes header names and values, so only foreign mappings need per-item decoding
+    if isinstance(headers, Headers):
+        return dict(headers.items())
+    return {
+        key.decode() if isinstance(key, bytes) else key: value.decode() if isinstance(value, bytes) else value
+        for key, value in headers.items()
+    }
+
 
 class LangGraphUser(BaseUser):
     """
@@ -37,32 +52,34 @@ class LangGraphUser(BaseUser):
     while preserving auth data.
     """
 
+    # Slots shadow BaseUser's abstract properties, so the core fields are plain attribute loads
+    __slots__ = ("_user_data", "identity", "display_name", "is_authenticated")
+
     def __init__(self, user_data: Auth.types.MinimalUserDict):
         self._user_data = user_data
-
-    @property
-    def identity(self) -> str:
-        return self._user_data["identity"]
-
-    @property
-    def is_authenticated(self) -> bool:
-        return self._user_data.get("is_authenticated", True)
-
-    @property
-    def display_name(self) -> str:
-        return self._user_data.get("display_name", self.identity)
+        self.identity: str = user_data["identity"]
+        self.display_name: str = user_data.get("display_name", self.identity)
+        self.is_authenticated: bool = user_data.get("is_authenticated", True)
 
     def __getattr__(self, name: str) -> Any:
         """Allow access to any additional fields from auth data"""
-        if name in self._user_data:
-            return self._user_data[name]
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        value = self._user_data.get(name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        return value
 
     def to_dict(self) -> MinimalUserDict:
         """Return the underlying user data dict"""
         return self._user_data.copy()
 
 
+# Returned for every request when no auth file is configured; the objects are never mutated
+_ANONYMOUS_AUTH_RESULT: tuple[AuthCredentials, BaseUser] = (
+    AuthCredentials([]),
+    LangGraphUser({"identity": "anonymous", "display_name": "Anonymous User", "is_authenticated": True}),
+)
+
+
 class LangGraphAuthBackend(AuthenticationBackend):
     """
     Authentication backend that uses the auth system.
@@ -72,6 +89,9 @@ class LangGraphAuthBackend(AuthenticationBackend):
     """
 
     def __init__(self) -> None:
+        # auth.path from the config, if any; set while loading so callers can tell
+        # "no auth configured" apart from "configured auth failed to load"
+        self.auth_path: str | None = None
         self.auth_instance = self._load_auth_instance()
 
     def _load_auth_instance(self) -> Auth | None:
@@ -89,6 +109,7 @@ class LangGraphAuthBackend(AuthenticationBackend):
             auth_config = load_auth_config()
             if auth_config and "path" in auth_config:
                 auth_path = auth_config["path"]
+                self.auth_path = auth_path
                 logger.info(f"Loading auth from config path: {auth_path}")
                 auth_instance = self._load_from_path(auth_path)
                 if auth_instance:
@@ -224,30 +245,19 @@ class LangGraphAuthBackend(AuthenticationBackend):
         # Default to noop (anonymous) authentication when no auth file is found,
         # regardless of AUTH_TYPE setting. This ensures the server works out-of-the-box.
         if self.auth_instance is None:
-            logger.debug("No auth file configured, defaulting to noop (anonymous) authentication")
-            # Return anonymous user when no auth is configured
-            user_data: Auth.types.MinimalUserDict = {
-                "identity": "anonymous",
-                "display_name": "Anonymous User",
-                "is_authenticated": True,
-            }
-            credentials = AuthCredentials([])
-            user = LangGraphUser(user_data)
-            return credentials, user
+            return _ANONYMOUS_AUTH_RESULT
 
-        if self.auth_instance._authenticate_handler is None:
+        authenticate_handler = self.auth_instance._authenticate_handler
+        if authenticate_handler is None:
             logger.warning("No authenticate handler configured, skipping authentication")
             return None
 
         try:
             # Convert headers to dict format expected by auth handlers
-            headers = {
-                key.decode() if isinstance(key, bytes) else key: value.decode() if isinstance(value, bytes) else value
-                for key, value in conn.headers.items()
-            }
+            headers = _headers_to_dict(conn.headers)
 
             # Call the authenticate handler
-            user_data = await self.auth_instance._authenticate_handler(headers)
+            user_data = await authenticate_handler(headers)
 
             if not user_data or not isinstance(user_data, dict):
                 raise AuthenticationError("Invalid user data returned from auth handler")
@@ -276,23 +286,6 @@ class LangGraphAuthBackend(AuthenticationBackend):
             raise AuthenticationError("Authentication system error") from e
 
 
-def get_auth_backend() -> AuthenticationBackend:
-    """
-    Get authentication backend based on AUTH_TYPE environment variable.
-
-    Returns:
-        AuthenticationBackend instance
-    """
-    auth_type = settings.app.AUTH_TYPE
-
-    if auth_type in ["noop", "custom"]:
-        logger.debug(f"Using auth backend with type: {auth_type}")
-        return LangGraphAuthBackend()
-    else:
-        logger.warning(f"Unknown AUTH_TYPE: {auth_type}, using noop")
-        return LangGraphAuthBackend()
-
-
 def on_auth_error(conn: HTTPConnection, exc: AuthenticationError) -> JSONResponse:
     """
     Handle authentication errors in Agent Protocol format.
@@ -316,16 +309,55 @@ def on_auth_error(conn: HTTPConnection, exc: AuthenticationError) -> JSONRespons
     )
 
 
-@functools.lru_cache(maxsize=1)
+# Process-wide backend; reads after the first construction skip the lock entirely
+_auth_backend: LangGraphAuthBackend | None = None
+_auth_backend_lock = threading.Lock()
+
+
+def get_auth_backend() -> LangGraphAuthBackend:
+    """
+    Get the process-wide authentication backend.
+
+    The backend (and the user's auth file) is loaded once per process
+    behind a double-checked lock; AUTH_TYPE is only consulted for logging.
+    A backend whose configured auth path failed to load is not cached, so
+    the next call retries the import.
+
+    Returns:
+        LangGraphAuthBackend instance
+    """
+    global _auth_backend
+    backend = _auth_backend
+    if backend is not None:
+        return backend
+    with _auth_backend_lock:
+        if _auth_backend is None:
+            auth_type = settings.app.AUTH_TYPE
+            if auth_type in ["noop", "custom"]:
+                logger.debug(f"Using auth backend with type: {auth_type}")
+            else:
+                logger.warning(f"Unknown AUTH_TYPE: {auth_type}, using noop")
+            backend = LangGraphAuthBackend()
+            if backend.auth_path is not None and backend.auth_instance is None:
+                return backend
+            _auth_backend = backend
+        return _auth_backend
+
+
 def get_auth_instance() -> Auth | None:
     """Get cached Auth instance for use by other modules.
 
-    Uses LRU cache to ensure only one Auth instance is loaded per process.
-    This allows other modules to access the same Auth instance used by
-    the middleware without re-loading it.
+    Returns the instance held by the shared backend, so the auth file is
+    imported once per process for both authentication and authorization.
 
     Returns:
         Auth instance or None if not configured/found
     """
-    backend = LangGraphAuthBackend()
-    return backend.auth_instance
+    return get_auth_backend().auth_instance
+
+
+def reset_auth_cache() -> None:
+    """Forget the cached backend so the next lookup reloads the auth file."""
+    global _auth_backend
+    with _auth_backend_lock:
+        _auth_backend = None
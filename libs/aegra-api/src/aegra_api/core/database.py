@@ -1,9 +1,16 @@
 """Database manager with LangGraph integration"""
 
+import json
+import math
+from typing import Any
+
+import orjson
 import structlog
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.store.postgres.aio import AsyncPostgresStore
+from psycopg import AsyncConnection
 from psycopg.rows import dict_row
+from psycopg.types.json import set_json_dumps
 from psycopg_pool import AsyncConnectionPool
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
@@ -13,6 +20,42 @@ from aegra_api.settings import settings
 logger = structlog.get_logger(__name__)
 
 
+def _contains_non_finite(obj: Any) -> bool:
+    """Return True if a NaN or infinite float is nested anywhere in obj."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_contains_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_contains_non_finite(item) for item in obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode JSON/JSONB parameters with orjson (psycopg accepts bytes)."""
+    try:
+        # Non-str keys are stringified like the stdlib json module does
+        encoded = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects ints beyond 64 bits; the stdlib encoder accepts them
+        return json.dumps(obj).encode()
+    # orjson writes NaN/Infinity as null; the stdlib keeps them (and Postgres rejects them)
+    if b"null" in encoded and _contains_non_finite(obj):
+        return json.dumps(obj).encode()
+    return encoded
+
+
+def _json_dumps_str(obj: Any) -> str:
+    """Encode JSON/JSONB parameters for SQLAlchemy, whose asyncpg codec expects str."""
+    return _json_dumps(obj).decode()
+
+
+async def _configure_lg_connection(conn: AsyncConnection) -> None:
+    """Route JSONB encoding on LangGraph pool connections through orjson."""
+    # Decoding stays on json.loads: orjson would turn ints beyond 64 bits into floats
+    set_json_dumps(_json_dumps, conn)
+
+
 class DatabaseManager:
     """Manages database connections and LangGraph persistence components"""
 
@@ -31,6 +74,9 @@ class DatabaseManager:
         if self.engine:
             return
 
+        # Prepared statements are only safe on direct connections (not PgBouncer transaction mode)
+        prepared = settings.db.DB_PREPARED_STATEMENTS
+
         # 1. SQLAlchemy Engine (app metadata, uses asyncpg)
         # We strictly limit this pool because the main load
         # is handled by LangGraph components.
@@ -40,13 +86,14 @@ class DatabaseManager:
             max_overflow=settings.pool.SQLALCHEMY_MAX_OVERFLOW,
             pool_pre_ping=True,
             echo=settings.db.DB_ECHO_LOG,
-            connect_args={"prepared_statement_cache_size": 0},  # PgBouncer compatibility
+            json_serializer=_json_dumps_str,
+            connect_args={} if prepared else {"prepared_statement_cache_size": 0},  # PgBouncer compatibility
         )
 
         lg_max = settings.pool.LANGGRAPH_MAX_POOL_SIZE
         lg_kwargs = {
             "autocommit": True,
-            "prepare_threshold": None,  # Disable prepared statements for PgBouncer compatibility
+            "prepare_threshold": 5 if prepared else None,  # None disables them for PgBouncer compatibility
             "row_factory": dict_row,  # LangGraph requires dictionary rows, not tuples
         }
 
@@ -58,6 +105,7 @@ class DatabaseManager:
             max_size=lg_max,
             open=False,
             kwargs=lg_kwargs,
+            configure=_configure_lg_connection,
             check=AsyncConnectionPool.check_connection,
         )
 
@@ -34,14 +34,15 @@ def merge_lifespans(user_app: FastAPI, core_lifespan: Callable) -> FastAPI:
             f"on_shutdown={user_app.router.on_shutdown}"
         )
 
+    # Decide once at merge time instead of on every lifespan entry
+    if not user_lifespan:
+        user_app.router.lifespan_context = core_lifespan
+        return user_app
+
     @asynccontextmanager
     async def combined_lifespan(app):
-        async with core_lifespan(app):
-            if user_lifespan:
-                async with user_lifespan(app):
-                    yield
-            else:
-                yield
+        async with core_lifespan(app), user_lifespan(app):
+            yield
 
     user_app.router.lifespan_context = combined_lifespan
     return user_app
@@ -60,10 +61,12 @@ def merge_exception_handlers(user_app: FastAPI, core_exception_handlers: dict[ty
     Returns:
         Modified user_app with merged exception handlers
     """
-    for exc_type, handler in core_exception_handlers.items():
-        if exc_type not in user_app.exception_handlers:
-            user_app.exception_handlers[exc_type] = handler
-        else:
-            logger.debug(f"User app overrides exception handler for {exc_type}")
-
+    user_handlers = user_app.exception_handlers
+    missing = {
+        exc_type: handler for exc_type, handler in core_exception_handlers.items() if exc_type not in user_handlers
+    }
+    for exc_type in core_exception_handlers.keys() - missing.keys():
+        logger.debug(f"User app overrides exception handler for {exc_type}")
+
+    user_handlers.update(missing)
     return user_app
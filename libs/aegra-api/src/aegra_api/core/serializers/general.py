@@ -1,14 +1,33 @@
 """General-purpose object serialization for complex objects"""
 
 import inspect
+import json
+from collections.abc import Callable
+from datetime import date, time
 from typing import Any
 
+import orjson
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
 from aegra_api.core.serializers.base import SerializationError, Serializer
 
+# Datetimes and dataclasses go through default to match json.dumps(default=serialize); unlike it,
+# orjson encodes plain Enums by value and NaN/Infinity as null
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+_DISPATCH_CACHE_SIZE = 1024
+
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class GeneralSerializer(Serializer):
     """Simple object serializer for complex Python objects"""
 
+    def __init__(self) -> None:
+        # Per-type handler chosen by _resolve_handler, so duck-typing checks run once per class
+        self._dispatch: dict[type, Callable[[Any], Any]] = {}
+
     def serialize(self, obj: Any) -> Any:
         """Serialize any object to JSON-compatible format"""
         try:
@@ -16,47 +35,136 @@ class GeneralSerializer(Serializer):
         except Exception as e:
             raise SerializationError(f"Failed to serialize object: {str(e)}", obj.__class__.__name__, e) from e
 
+    def serialize_json(self, obj: Any) -> bytes:
+        """Serialize any object straight to compact UTF-8 JSON bytes
+
+        Containers are walked by orjson in C; serialize() only runs for leaf
+        objects orjson does not understand.
+        """
+        try:
+            return orjson.dumps(obj, default=self._json_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError as e:
+            # A failure inside default would just repeat in the stdlib encoder
+            if e.__cause__ is not None:
+                raise e.__cause__
+        # orjson rejects ints beyond 64 bits and lone surrogates; escaping keeps the latter encodable
+        try:
+            return json.dumps(obj, default=self.serialize, separators=(",", ":")).encode()
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"Failed to serialize object: {str(e)}", obj.__class__.__name__, e) from e
+
+    def _json_default(self, obj: Any) -> Any:
+        """orjson fallback mirroring json.dumps, which encodes tuple subclasses as arrays"""
+        if isinstance(obj, tuple):
+            return list(obj)
+        return self.serialize(obj)
+
     def _serialize_object(self, obj: Any) -> Any:
-        """Core serialization logic for Python objects"""
+        """Core serialization logic for Python objects
+
+        Returns JSON primitives after one call, except for objects with a
+        non-pydantic model_dump()/dict(), whose output is returned as-is.
+        """
+        cls = type(obj)
+        # Exact builtins skip the handler lookup; subclasses resolve like any other type
+        if cls is str or cls is int or cls is float or cls is bool or obj is None:
+            return obj
+        if cls is dict:
+            return {k: self._serialize_object(v) for k, v in obj.items()}
+        if cls is list or cls is tuple:
+            return [self._serialize_object(item) for item in obj]
+
+        handler = self._dispatch.get(cls)
+        if handler is None:
+            handler = self._resolve_handler(obj)
+            # Bounded so dynamically created classes (e.g. per-request models) cannot grow it forever
+            if len(self._dispatch) < _DISPATCH_CACHE_SIZE:
+                self._dispatch[cls] = handler
+        return handler(obj)
+
+    def _resolve_handler(self, obj: Any) -> Callable[[Any], Any]:
+        """Pick the serialization handler for obj's type; called once per type"""
         # Class objects (e.g. a Pydantic class passed to with_structured_output)
         # carry bound-method descriptors but cannot be dump()'d without an
         # instance. Render them by qualname so duck-typed checks below don't
         # invoke unbound methods.
         if inspect.isclass(obj):
-            return f"{obj.__module__}.{obj.__qualname__}"
+            return _serialize_class
+
+        # Pydantic v2 models dump straight to JSON primitives; unknown leaves fall back to this serializer
+        if isinstance(obj, BaseModel):
+            return self._serialize_pydantic
 
-        # Handle Pydantic v2 models (model_dump method)
+        # Handle other objects exposing a model_dump method
         if hasattr(obj, "model_dump") and callable(obj.model_dump):
-            return obj.model_dump()
+            return _serialize_model_dump
 
         # Handle LangChain objects and Pydantic v1 models (dict method)
         elif hasattr(obj, "dict") and callable(obj.dict):
-            return obj.dict()
+            return _serialize_dict_method
 
         # Handle LangGraph Interrupt objects (they don't have .dict() method)
         elif obj.__class__.__name__ == "Interrupt" and hasattr(obj, "value") and hasattr(obj, "id"):
-            return {"value": self._serialize_object(obj.value), "id": obj.id}
+            return self._serialize_interrupt
 
         # Handle NamedTuples (like PregelTask) - they have _asdict() method
         elif hasattr(obj, "_asdict") and callable(obj._asdict):
-            return {k: self._serialize_object(v) for k, v in obj._asdict().items()}
+            return self._serialize_namedtuple
+
+        # Dates and times use pydantic's ISO format, matching values nested in models
+        elif isinstance(obj, (date, time)):
+            return to_jsonable_python
 
         # Handle sets and frozensets
         elif isinstance(obj, (set, frozenset)):
-            return list(obj)
+            return list
 
         # Handle tuples and lists recursively
         elif isinstance(obj, (tuple, list)):
-            return [self._serialize_object(item) for item in obj]
+            return self._serialize_sequence
 
         # Handle dictionaries recursively
         elif isinstance(obj, dict):
-            return {k: self._serialize_object(v) for k, v in obj.items()}
+            return self._serialize_mapping
 
         # Handle basic JSON-serializable types
         elif isinstance(obj, (str, int, float, bool, type(None))):
-            return obj
+            return _identity
 
         # Fallback to string representation for unknown types
         else:
-            return str(obj)
+            return str
+
+    def _serialize_pydantic(self, obj: BaseModel) -> Any:
+        return obj.model_dump(mode="json", fallback=self._serialize_object)
+
+    def _serialize_interrupt(self, obj: Any) -> dict[str, Any]:
+        return {"value": self._serialize_object(obj.value), "id": obj.id}
+
+    def _serialize_namedtuple(self, obj: Any) -> dict[str, Any]:
+        fields = obj._asdict()
+        if all(type(v) in _PRIMITIVE_TYPES for v in fields.values()):
+            return fields
+        return {k: self._serialize_object(v) for k, v in fields.items()}
+
+    def _serialize_sequence(self, obj: Any) -> list[Any]:
+        return [self._serialize_object(item) for item in obj]
+
+    def _serialize_mapping(self, obj: Any) -> dict[Any, Any]:
+        return {k: self._serialize_object(v) for k, v in obj.items()}
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+def _serialize_class(obj: type) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _serialize_model_dump(obj: Any) -> Any:
+    return obj.model_dump()
+
+
+def _serialize_dict_method(obj: Any) -> Any:
+    return obj.dict()
@@ -19,7 +19,8 @@ class LangGraphSerializer(Serializer):
 
     def serialize(self, obj: Any) -> Any:
         """Main serialization entry point"""
-        return json.loads(json.dumps(obj, default=self.general_serializer.serialize))
+        # json.loads keeps ints beyond 64 bits exact; orjson would decode them as floats
+        return json.loads(self.general_serializer.serialize_json(obj))
 
     def serialize_task(self, task: Any) -> dict[str, Any]:
         """Serialize a LangGraph task to ThreadTask format"""
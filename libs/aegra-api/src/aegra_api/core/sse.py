@@ -133,9 +133,11 @@ def format_sse_message(
     if data is None:
         data_str = ""
     else:
-        # Use our general serializer by default to handle complex objects
-        default_serializer = serializer or _serializer.serialize
-        data_str = json.dumps(data, default=default_serializer, separators=(",", ":"), ensure_ascii=False)
+        if serializer is None:
+            # Use our general serializer by default to handle complex objects
+            data_str = _serializer.serialize_json(data).decode()
+        else:
+            data_str = json.dumps(data, default=serializer, separators=(",", ":"), ensure_ascii=False)
         data_str = _decode_literal_unicode_escapes(data_str)
 
     lines.append(f"data: {data_str}")
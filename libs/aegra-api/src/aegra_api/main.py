@@ -1,5 +1,6 @@
 """FastAPI application for Aegra (Agent Protocol Server)"""
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -20,6 +21,7 @@ from aegra_api.api.threads import router as threads_router
 from aegra_api.config import CorsConfig, HttpConfig, get_config_dir, load_http_config
 from aegra_api.core.app_loader import load_custom_app
 from aegra_api.core.auth_deps import auth_dependency
+from aegra_api.core.auth_middleware import get_auth_backend
 from aegra_api.core.database import db_manager
 from aegra_api.core.health import router as health_router
 from aegra_api.core.migrations import run_migrations_async
@@ -85,19 +87,36 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     else:
         logger.info("skipping startup migrations (RUN_MIGRATIONS_ON_STARTUP=false)")
 
-    # Startup: Initialize database and LangGraph components
+    # Import the auth file in a worker thread while the database pools warm up
+    auth_warmup = asyncio.create_task(asyncio.to_thread(get_auth_backend))
+
     try:
-        await db_manager.initialize()
-    except (ConnectionRefusedError, OSError) as e:
-        _log_connection_help(e)
+        # Startup: Initialize database and LangGraph components
+        try:
+            await db_manager.initialize()
+        except (ConnectionRefusedError, OSError) as e:
+            _log_connection_help(e)
+            raise
+
+        # Observability
+        setup_observability()
+
+        # Initialize LangGraph service
+        langgraph_service = get_langgraph_service()
+        await langgraph_service.initialize()
+    except BaseException:
+        # Don't leave the warmup task orphaned when startup fails
+        auth_warmup.cancel()
         raise
 
-    # Observability
-    setup_observability()
+    # The first request must not pay for the auth file import
+    await auth_warmup
 
-    # Initialize LangGraph service
-    langgraph_service = get_langgraph_service()
-    await langgraph_service.initialize()
+    # A configured auth file that failed to load (retried here on the loop thread)
+    # would otherwise leave every request unauthenticated
+    auth_backend = get_auth_backend()
+    if auth_backend.auth_path is not None and auth_backend.auth_instance is None:
+        raise RuntimeError(f"Failed to load auth from {auth_backend.auth_path}; refusing to start without it")
 
     # Initialize Redis broker (if enabled)
     if settings.redis.REDIS_BROKER_ENABLED:
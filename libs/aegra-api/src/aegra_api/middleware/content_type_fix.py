@@ -11,16 +11,20 @@ re-parse the body, so it's safe for large payloads and streaming.
 
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-# Content types that likely contain JSON but aren't labeled correctly.
-_TEXT_CONTENT_TYPES = (
-    b"text/plain",
-    b"text/plain;charset=utf-8",
-    b"text/plain;charset=UTF-8",
-    b"text/plain; charset=utf-8",
-    b"text/plain; charset=UTF-8",
+# Content types that likely contain JSON but aren't labeled correctly (matched lowercased).
+_TEXT_CONTENT_TYPES = frozenset(
+    {
+        b"text/plain",
+        b"text/plain;charset=utf-8",
+        b"text/plain; charset=utf-8",
+    }
 )
 
-_METHODS_WITH_BODY = {b"POST", b"PUT", b"PATCH"}
+# Every candidate starts with "t"/"T", so other content types skip the lower() copy.
+_TEXT_FIRST_BYTES = frozenset(b"tT")
+
+# ASGI http scopes always carry the method as str; bytes are accepted for hand-built scopes.
+_METHODS_WITH_BODY = frozenset({"POST", "PUT", "PATCH", b"POST", b"PUT", b"PATCH"})
 
 
 class ContentTypeFixMiddleware:
@@ -38,9 +42,7 @@ class ContentTypeFixMiddleware:
             await self.app(scope, receive, send)
             return
 
-        method_raw = scope.get("method", "")
-        method: bytes = method_raw.encode() if isinstance(method_raw, str) else method_raw or b""
-        if method not in _METHODS_WITH_BODY:
+        if scope["method"] not in _METHODS_WITH_BODY:
             await self.app(scope, receive, send)
             return
 
@@ -48,9 +50,10 @@ class ContentTypeFixMiddleware:
         new_headers = None
 
         for i, (name, value) in enumerate(headers):
-            if name == b"content-type" and value.lower() in _TEXT_CONTENT_TYPES:
-                new_headers = list(headers)
-                new_headers[i] = (b"content-type", b"application/json")
+            if name == b"content-type":
+                if value and value[0] in _TEXT_FIRST_BYTES and value.lower() in _TEXT_CONTENT_TYPES:
+                    new_headers = list(headers)
+                    new_headers[i] = (b"content-type", b"application/json")
                 break
 
         if new_headers is not None:
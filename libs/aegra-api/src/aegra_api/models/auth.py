@@ -29,16 +29,16 @@ class User(BaseModel):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict including all extra fields."""
-        return self.model_dump()
+        # Same output as model_dump() without its per-call argument handling
+        return self.__pydantic_serializer__.to_python(self)
 
     def __getattr__(self, name: str) -> Any:
         """Allow attribute access to extra fields."""
-        try:
-            extra = object.__getattribute__(self, "__pydantic_extra__") or {}
-        except AttributeError:
-            extra = {}
-        if name in extra:
-            return extra[name]
+        # An unset __pydantic_extra__ re-enters here; the name guard stops the recursion
+        if name != "__pydantic_extra__":
+            extra = self.__pydantic_extra__
+            if extra and name in extra:
+                return extra[name]
         raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
 
@@ -10,7 +10,7 @@ from openinference.instrumentation.langchain import LangChainInstrumentor
 from opentelemetry import trace
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
 
 from aegra_api.observability.base import ObservabilityProvider
 from aegra_api.observability.span_enrichment import SpanEnrichmentProcessor
@@ -33,6 +33,9 @@ class OpenTelemetryProvider(ObservabilityProvider):
     def __init__(self) -> None:
         self._enabled = False
         self._tracer_provider: TracerProvider | None = None
+        # Set when setup() found nothing to export; _enabled is left alone so the
+        # module-level singleton can still be registered
+        self._no_exporters = False
 
         # Defining the list of active targets
         self._active_targets: list[BaseOtelTarget] = self._resolve_targets()
@@ -73,6 +76,7 @@ class OpenTelemetryProvider(ObservabilityProvider):
         if isinstance(target, LangfuseTarget):
             self._has_langfuse = True
         self._enabled = True
+        self._no_exporters = False
 
         if self._tracer_provider is not None:
             try:
@@ -85,10 +89,26 @@ class OpenTelemetryProvider(ObservabilityProvider):
 
     def setup(self) -> None:
         """Initializes the Global Tracer Provider. Runs once."""
-        if self._tracer_provider:
+        if self._tracer_provider or self._no_exporters:
             return
 
-        # 1. Resource
+        # 1. Build exporters first; with none attached there is nothing to trace
+        exporters: list[tuple[str, SpanExporter]] = []
+        for target in self._active_targets:
+            try:
+                exporter = target.get_exporter()
+                if exporter:
+                    exporters.append((target.name, exporter))
+            except Exception as e:
+                logger.error(f"Observability: Failed to attach target '{target.name}': {e}")
+
+        console_export = settings.observability.OTEL_CONSOLE_EXPORT
+        if not exporters and not console_export:
+            self._no_exporters = True
+            logger.info("Observability: No exporters configured, tracing disabled")
+            return
+
+        # 2. Resource
         resource = Resource.create(
             attributes={
                 "service.name": settings.observability.OTEL_SERVICE_NAME,
@@ -99,31 +119,21 @@ class OpenTelemetryProvider(ObservabilityProvider):
 
         self._tracer_provider = TracerProvider(resource=resource)
         self._tracer_provider.add_span_processor(SpanEnrichmentProcessor())
-        processors_count = 0
 
-        # 2. Attach Exporters
-        for target in self._active_targets:
-            try:
-                exporter = target.get_exporter()
-                if exporter:
-                    processor = BatchSpanProcessor(exporter)
-                    self._tracer_provider.add_span_processor(processor)
-                    processors_count += 1
-                    logger.info(f"Observability: Attached target '{target.name}'")
-            except Exception as e:
-                logger.error(f"Observability: Failed to attach target '{target.name}': {e}")
+        # 3. Attach Exporters
+        for name, exporter in exporters:
+            self._tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+            logger.info(f"Observability: Attached target '{name}'")
 
-        # 3. Console Exporter
-        if settings.observability.OTEL_CONSOLE_EXPORT:
+        # 4. Console Exporter
+        if console_export:
             self._tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
-            processors_count += 1
             logger.info("Observability: Console export enabled")
 
-        # 4. Set Global Tracer & Instrument
-        if processors_count > 0:
-            trace.set_tracer_provider(self._tracer_provider)
-            LangChainInstrumentor().instrument(tracer_provider=self._tracer_provider)
-            logger.info("Observability: Auto-instrumentation enabled")
+        # 5. Set Global Tracer & Instrument
+        trace.set_tracer_provider(self._tracer_provider)
+        LangChainInstrumentor().instrument(tracer_provider=self._tracer_provider)
+        logger.info("Observability: Auto-instrumentation enabled")
 
     def get_callbacks(self) -> list[Any]:
         if self.is_enabled():
@@ -45,7 +45,7 @@ _BACKOFF_FACTOR = 2.0
 
 def _serialize_payload(payload: Any) -> str:
     """Serialize an event payload to a JSON string for Redis transport."""
-    return json.dumps(payload, default=_serializer.serialize)
+    return _serializer.serialize_json(payload).decode()
 
 
 def _deserialize_payload(raw: Any) -> Any:
@@ -86,12 +86,7 @@ class RedisRunBroker(BaseRunBroker):
             logger.warning(f"Attempted to put event {event_id} into finished broker for run {self.run_id}")
             return
 
-        message = json.dumps(
-            {
-                "event_id": event_id,
-                "payload": json.loads(_serialize_payload(payload)),
-            }
-        )
+        message = _serialize_payload({"event_id": event_id, "payload": payload})
 
         is_end = isinstance(payload, tuple) and len(payload) >= 1 and payload[0] == "end"
 
@@ -140,6 +140,8 @@ class DatabaseSettings(EnvBase):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "aegra"
     DB_ECHO_LOG: bool = False
+    # Off by default: PgBouncer/RDS Proxy transaction pooling breaks server-side prepared statements
+    DB_PREPARED_STATEMENTS: bool = False
 
     @staticmethod
     def _normalize_scheme(url: str, target_scheme: str) -> str:
@@ -125,15 +125,15 @@ def runs_client():
 def clear_auth_cache():
     """Clear auth instance cache before and after each test.
 
-    The get_auth_instance() function uses @lru_cache which can cause
+    The get_auth_instance() function caches its result per process which can cause
     test isolation issues when different tests need different auth configurations.
     This fixture ensures each test starts with a clean auth state.
     """
-    from aegra_api.core.auth_middleware import get_auth_instance
+    from aegra_api.core.auth_middleware import reset_auth_cache
 
-    get_auth_instance.cache_clear()
+    reset_auth_cache()
     yield
-    get_auth_instance.cache_clear()
+    reset_auth_cache()
 
 
 # --- AUTO-SKIP GEO-BLOCK FAILURES ---
@@ -1,9 +1,11 @@
 """Unit tests for auth dependencies"""
 
 from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException, Request
+from pydantic import ValidationError
 from starlette.authentication import AuthCredentials
 
 from aegra_api.core.auth_deps import (
@@ -12,6 +14,7 @@ from aegra_api.core.auth_deps import (
     auth_dependency,
     get_current_user,
     require_auth,
+    require_permission,
 )
 from aegra_api.core.auth_middleware import LangGraphUser
 from aegra_api.models.auth import User
@@ -175,6 +178,54 @@ class TestGetCurrentUser:
 
         assert exc_info.value.status_code == 401
 
+    @pytest.mark.asyncio
+    async def test_get_current_user_reuses_model_built_by_require_auth(self) -> None:
+        """require_auth + get_current_user on one request convert the user once"""
+        langgraph_user = LangGraphUser({"identity": "user-123"})
+        mock_backend = Mock()
+        mock_backend.authenticate = AsyncMock(return_value=(AuthCredentials([]), langgraph_user))
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {}
+
+        with patch("aegra_api.core.auth_deps.get_auth_backend", return_value=mock_backend):
+            auth_user = await require_auth(mock_request)
+        current_user = get_current_user(mock_request)
+
+        assert current_user is auth_user
+
+    def test_get_current_user_ignores_cached_model_for_other_user(self) -> None:
+        """A cached model for a different raw user object is not reused"""
+        stale_user = LangGraphUser({"identity": "stale"})
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {
+            "user": LangGraphUser({"identity": "user-123"}),
+            "aegra_user_model": (stale_user, User(identity="stale")),
+        }
+
+        user = get_current_user(mock_request)
+
+        assert user.identity == "user-123"
+
+    def test_get_current_user_returns_scope_user_model_as_is(self) -> None:
+        """A User model already in scope is returned without re-conversion"""
+        scope_user = User(identity="user-123", team_id="team-1")
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {"user": scope_user}
+
+        user = get_current_user(mock_request)
+
+        assert user is scope_user
+
+    def test_get_current_user_rejects_unauthenticated_scope_user_model(self) -> None:
+        """A User model with is_authenticated=False still raises 401"""
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {"user": User(identity="user-123", is_authenticated=False)}
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(mock_request)
+
+        assert exc_info.value.status_code == 401
+
 
 class TestToUserModel:
     """Test _to_user_model helper function"""
@@ -224,6 +275,108 @@ class TestToUserModel:
 
         assert exc_info.value.status_code == 401
 
+    def test_to_user_model_preserves_extra_fields(self) -> None:
+        """Extra auth fields stay accessible without re-validation"""
+        user_data = {"identity": "user-123", "team_id": "team-1"}
+
+        user = _to_user_model(user_data)
+
+        assert user.team_id == "team-1"
+        assert user.to_dict()["team_id"] == "team-1"
+
+    def test_user_missing_attribute_raises(self) -> None:
+        """Unknown attributes raise AttributeError so hasattr() stays False"""
+        user = _to_user_model({"identity": "user-123", "team_id": "team-1"})
+
+        assert not hasattr(user, "model_dump_json_fast")
+        with pytest.raises(AttributeError, match="no attribute 'tenant'"):
+            _ = user.tenant
+
+    def test_to_user_model_stringifies_identity_and_display_name(self) -> None:
+        """Non-str identity/display_name from custom handlers are coerced to str"""
+        identity = uuid4()
+
+        user = _to_user_model({"identity": identity, "display_name": 42})
+        defaulted = _to_user_model({"identity": identity})
+
+        assert user.identity == str(identity)
+        assert user.display_name == "42"
+        assert defaulted.display_name == str(identity)
+
+    def test_to_user_model_none_identity_rejected(self) -> None:
+        """An explicit None identity is treated as missing"""
+        with pytest.raises(HTTPException) as exc_info:
+            _to_user_model({"identity": None})
+
+        assert exc_info.value.status_code == 401
+
+    def test_to_user_model_coerces_is_authenticated(self) -> None:
+        """A string is_authenticated goes through validation instead of staying truthy"""
+        user = _to_user_model({"identity": "user-123", "is_authenticated": "false"})
+
+        assert user.is_authenticated is False
+
+    @pytest.mark.parametrize("field", ["org_id", "email"])
+    @pytest.mark.parametrize("value", [123, uuid4()])
+    def test_to_user_model_rejects_non_str_optional_fields(self, field: str, value: object) -> None:
+        """Non-str org_id/email are validated like before, not constructed blindly"""
+        with pytest.raises(ValidationError):
+            _to_user_model({"identity": "user-123", field: value})
+
+    def test_to_user_model_rejects_non_str_permission_items(self) -> None:
+        """Permission lists with non-str items are validated"""
+        with pytest.raises(ValidationError):
+            _to_user_model({"identity": "user-123", "permissions": ["read", 1]})
+
+    def test_to_user_model_normalizes_permissions(self) -> None:
+        """Tuple and string permissions are normalized to a list"""
+        from_tuple = _to_user_model({"identity": "user-123", "permissions": ("read", "write")})
+        from_str = _to_user_model({"identity": "user-123", "permissions": "admin"})
+        missing = _to_user_model({"identity": "user-123"})
+
+        assert from_tuple.permissions == ["read", "write"]
+        assert from_str.permissions == ["admin"]
+        assert missing.permissions == []
+
+
+class TestRequirePermission:
+    """Test require_permission dependency factory"""
+
+    def test_allows_user_with_permission(self) -> None:
+        """User holding the permission is returned"""
+        user = User(identity="user-123", permissions=["read", "admin"])
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {}
+
+        result = require_permission("admin")(mock_request, user)
+
+        assert result is user
+
+    def test_rejects_user_without_permission(self) -> None:
+        """Missing permission raises 403"""
+        user = User(identity="user-123", permissions=["read"])
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {}
+
+        with pytest.raises(HTTPException) as exc_info:
+            require_permission("admin")(mock_request, user)
+
+        assert exc_info.value.status_code == 403
+        assert "admin" in exc_info.value.detail
+
+    def test_reuses_permission_set_across_checks(self) -> None:
+        """Multiple checks on one request build the permission set once"""
+        user = User(identity="user-123", permissions=["read", "write"])
+        mock_request = Mock(spec=Request)
+        mock_request.scope = {}
+
+        require_permission("read")(mock_request, user)
+        permission_set = mock_request.scope["aegra_permission_set"]
+        require_permission("write")(mock_request, user)
+
+        assert mock_request.scope["aegra_permission_set"] is permission_set
+        assert permission_set == frozenset({"read", "write"})
+
 
 class TestTypeAliases:
     """Test type aliases and constants"""
@@ -45,6 +45,21 @@ class TestAuthContextWrapper:
         assert langgraph_ctx.user.identity == "user-123"
         assert langgraph_ctx.user.display_name == "Test User"
 
+    def test_permissions_are_always_lists(self) -> None:
+        """Permission-less users get a list too, so handlers can extend it uniformly"""
+        without = AuthContextWrapper(User(identity="user-1"), "threads", "read")
+        with_perms = AuthContextWrapper(User(identity="user-2", permissions=["read"]), "runs", "create")
+
+        assert without.permissions == []
+        assert without.permissions + ["x"] == ["x"]
+        assert type(without.permissions) is type(with_perms.permissions) is list
+
+    def test_uses_slots(self) -> None:
+        """Wrapper is slotted, so it carries no per-instance __dict__"""
+        ctx = AuthContextWrapper(User(identity="user-123"), "threads", "read")
+
+        assert not hasattr(ctx, "__dict__")
+
 
 class TestBuildAuthContext:
     """Test build_auth_context helper"""
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from starlette.authentication import AuthCredentials, AuthenticationError
+from starlette.datastructures import Headers
 from starlette.requests import HTTPConnection
 from starlette.responses import JSONResponse
 
@@ -13,7 +14,9 @@ from aegra_api.core.auth_middleware import (
     LangGraphAuthBackend,
     LangGraphUser,
     get_auth_backend,
+    get_auth_instance,
     on_auth_error,
+    reset_auth_cache,
 )
 
 
@@ -237,6 +240,23 @@ class TestLangGraphAuthBackend:
             assert user.identity == "anonymous"
             assert user.display_name == "Anonymous User"
 
+    @pytest.mark.asyncio
+    async def test_authenticate_noop_reuses_anonymous_result(self) -> None:
+        """Anonymous auth returns the same prebuilt credentials and user on every call"""
+        backend = LangGraphAuthBackend()
+        backend.auth_instance = None
+        mock_conn = Mock(spec=HTTPConnection)
+
+        first = await backend.authenticate(mock_conn)
+        second = await backend.authenticate(mock_conn)
+
+        assert first is second
+        assert first[1].to_dict() == {
+            "identity": "anonymous",
+            "display_name": "Anonymous User",
+            "is_authenticated": True,
+        }
+
     @pytest.mark.asyncio
     async def test_authenticate_no_handler(self):
         """Test authentication when no handler is configured"""
@@ -378,6 +398,30 @@ class TestLangGraphAuthBackend:
         }
         mock_auth_instance._authenticate_handler.assert_called_once_with(expected_headers)
 
+    @pytest.mark.asyncio
+    async def test_authenticate_passes_starlette_headers_as_dict(self) -> None:
+        """Starlette Headers are passed through as a plain str dict, last value winning"""
+        mock_auth_instance = Mock()
+        mock_auth_instance._authenticate_handler = AsyncMock(return_value={"identity": "user-123"})
+
+        backend = LangGraphAuthBackend()
+        backend.auth_instance = mock_auth_instance
+
+        mock_conn = Mock(spec=HTTPConnection)
+        mock_conn.headers = Headers(
+            raw=[
+                (b"authorization", b"Bearer token123"),
+                (b"x-tenant", b"first"),
+                (b"x-tenant", b"second"),
+            ]
+        )
+
+        await backend.authenticate(mock_conn)
+
+        mock_auth_instance._authenticate_handler.assert_called_once_with(
+            {"authorization": "Bearer token123", "x-tenant": "second"}
+        )
+
 
 class TestGetAuthBackend:
     """Test get_auth_backend function"""
@@ -407,6 +451,79 @@ class TestGetAuthBackend:
             assert isinstance(backend, LangGraphAuthBackend)
 
 
+class TestSharedAuthBackend:
+    """Test that authentication and authorization share one backend"""
+
+    def test_get_auth_backend_returns_same_instance(self) -> None:
+        """The backend is constructed once per process"""
+        with patch.object(LangGraphAuthBackend, "_load_auth_instance", return_value=None) as mock_load:
+            first = get_auth_backend()
+            second = get_auth_backend()
+
+        assert first is second
+        mock_load.assert_called_once()
+
+    def test_get_auth_backend_retries_failed_configured_path(self) -> None:
+        """A configured auth path that failed to load is not cached"""
+        with (
+            patch("aegra_api.core.auth_middleware.load_auth_config", return_value={"path": "./auth.py:auth"}),
+            patch.object(LangGraphAuthBackend, "_load_from_path", side_effect=[None, Mock()]) as mock_load,
+        ):
+            first = get_auth_backend()
+            second = get_auth_backend()
+            third = get_auth_backend()
+
+        assert first.auth_path == "./auth.py:auth"
+        assert first.auth_instance is None
+        assert second is not first
+        assert second.auth_instance is not None
+        assert third is second
+        assert mock_load.call_count == 2
+
+    def test_get_auth_instance_uses_backend_auth_instance(self) -> None:
+        """get_auth_instance() reuses the backend's auth instance instead of loading again"""
+        sentinel_auth = Mock()
+        with patch.object(LangGraphAuthBackend, "_load_auth_instance", return_value=sentinel_auth) as mock_load:
+            backend = get_auth_backend()
+            auth_instance = get_auth_instance()
+
+        assert auth_instance is backend.auth_instance is sentinel_auth
+        mock_load.assert_called_once()
+
+
+class TestGetAuthInstance:
+    """Test get_auth_instance process-wide caching"""
+
+    def test_loads_auth_instance_once(self) -> None:
+        """Repeated lookups reuse the first loaded instance"""
+        sentinel_auth = Mock()
+        with patch.object(LangGraphAuthBackend, "_load_auth_instance", return_value=sentinel_auth) as mock_load:
+            first = get_auth_instance()
+            second = get_auth_instance()
+
+        assert first is sentinel_auth
+        assert second is sentinel_auth
+        mock_load.assert_called_once()
+
+    def test_caches_missing_auth_instance(self) -> None:
+        """A missing auth config (None) is cached too, not reloaded per call"""
+        with patch.object(LangGraphAuthBackend, "_load_auth_instance", return_value=None) as mock_load:
+            assert get_auth_instance() is None
+            assert get_auth_instance() is None
+
+        mock_load.assert_called_once()
+
+    def test_reset_auth_cache_forces_reload(self) -> None:
+        """reset_auth_cache() makes the next lookup load again"""
+        with patch.object(LangGraphAuthBackend, "_load_auth_instance", side_effect=[Mock(), Mock()]) as mock_load:
+            first = get_auth_instance()
+            reset_auth_cache()
+            second = get_auth_instance()
+
+        assert first is not second
+        assert mock_load.call_count == 2
+
+
 class TestOnAuthError:
     """Test on_auth_error function"""
 
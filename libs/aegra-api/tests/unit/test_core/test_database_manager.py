@@ -1,10 +1,12 @@
+import json
 import os
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 # Adjust the import path to match your project structure
-from aegra_api.core.database import DatabaseManager
+from aegra_api.core.database import DatabaseManager, _configure_lg_connection, _json_dumps, _json_dumps_str
 from aegra_api.settings import settings
 
 
@@ -89,6 +91,9 @@ class TestDatabaseManager:
 
         assert kwargs["pool_size"] == settings.pool.SQLALCHEMY_POOL_SIZE
         assert kwargs["pool_pre_ping"] is True
+        assert kwargs["json_serializer"] is _json_dumps_str
+        # Decoding keeps SQLAlchemy's json.loads default so big ints stay exact
+        assert "json_deserializer" not in kwargs
 
         # 2. Verify LangGraph Pool creation
         mock_db_deps["pool_cls"].assert_called_once()
@@ -98,6 +103,7 @@ class TestDatabaseManager:
         assert lg_kwargs["max_size"] == settings.pool.LANGGRAPH_MAX_POOL_SIZE
         assert lg_kwargs["open"] is False
         assert "check" in lg_kwargs
+        assert lg_kwargs["configure"] is _configure_lg_connection
 
         # Verify pool options inside kwargs
         inner_kwargs = lg_kwargs["kwargs"]
@@ -119,6 +125,55 @@ class TestDatabaseManager:
         assert db_manager.engine == mock_db_deps["engine_instance"]
         assert db_manager.lg_pool == mock_db_deps["pool_instance"]
 
+    async def test_initialize_prepared_statements_disabled_by_default(
+        self, db_manager: DatabaseManager, mock_db_deps: dict[str, Any]
+    ) -> None:
+        """Both pools skip server-side prepared statements unless explicitly enabled."""
+        await db_manager.initialize()
+
+        _, engine_kwargs = mock_db_deps["create_engine"].call_args
+        assert engine_kwargs["connect_args"] == {"prepared_statement_cache_size": 0}
+        _, lg_kwargs = mock_db_deps["pool_cls"].call_args
+        assert lg_kwargs["kwargs"]["prepare_threshold"] is None
+
+    async def test_initialize_prepared_statements_enabled(
+        self, db_manager: DatabaseManager, mock_db_deps: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """DB_PREPARED_STATEMENTS restores the drivers' prepared statement caches."""
+        monkeypatch.setattr(settings.db, "DB_PREPARED_STATEMENTS", True)
+
+        await db_manager.initialize()
+
+        _, engine_kwargs = mock_db_deps["create_engine"].call_args
+        assert engine_kwargs["connect_args"] == {}
+        _, lg_kwargs = mock_db_deps["pool_cls"].call_args
+        assert lg_kwargs["kwargs"]["prepare_threshold"] == 5
+
+    def test_json_dumps_str_matches_stdlib_semantics(self) -> None:
+        """orjson-backed serializer stringifies non-str keys and returns text."""
+        assert _json_dumps_str({"a": [1, None], 2: True}) == '{"a":[1,null],"2":true}'
+
+    def test_json_dumps_falls_back_for_big_ints(self) -> None:
+        """Ints beyond 64 bits are encoded by the stdlib and decode back exactly."""
+        encoded = _json_dumps_str({"n": 2**70})
+        assert json.loads(encoded) == {"n": 2**70}
+
+    def test_json_dumps_keeps_non_finite_floats(self) -> None:
+        """NaN is not silently rewritten to null."""
+        assert _json_dumps({"a": None, "b": float("nan")}) == b'{"a": null, "b": NaN}'
+
+    async def test_configure_lg_connection_only_overrides_dumps(self) -> None:
+        """Pool connections encode with orjson but keep psycopg's json.loads decoding."""
+        conn = MagicMock()
+        with (
+            patch("aegra_api.core.database.set_json_dumps") as mock_set_dumps,
+            patch("psycopg.types.json.set_json_loads") as mock_set_loads,
+        ):
+            await _configure_lg_connection(conn)
+
+        mock_set_dumps.assert_called_once_with(_json_dumps, conn)
+        mock_set_loads.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_initialize_idempotency(self, db_manager, mock_db_deps):
         """Test that initialize returns early if the database is already initialized."""
@@ -1,5 +1,6 @@
 """Unit tests for route merger"""
 
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 import pytest
@@ -59,6 +60,44 @@ def test_merge_lifespans_with_user_lifespan(user_app):
     assert merged_app.router.lifespan_context is not None
 
 
+async def test_merge_lifespans_runs_core_around_user(user_app: FastAPI) -> None:
+    """Core lifespan starts first and shuts down last"""
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def core_lifespan(app: FastAPI) -> AsyncIterator[None]:
+        events.append("core start")
+        yield
+        events.append("core stop")
+
+    @asynccontextmanager
+    async def user_lifespan(app: FastAPI) -> AsyncIterator[None]:
+        events.append("user start")
+        yield
+        events.append("user stop")
+
+    user_app.router.lifespan_context = user_lifespan
+    merged_app = merge_lifespans(user_app, core_lifespan)
+
+    async with merged_app.router.lifespan_context(merged_app):
+        events.append("serving")
+
+    assert events == ["core start", "user start", "serving", "user stop", "core stop"]
+
+
+def test_merge_lifespans_without_user_lifespan_uses_core_directly(user_app: FastAPI) -> None:
+    """A missing user lifespan installs the core lifespan unwrapped"""
+
+    @asynccontextmanager
+    async def core_lifespan(app: FastAPI) -> AsyncIterator[None]:
+        yield
+
+    user_app.router.lifespan_context = None
+    merged_app = merge_lifespans(user_app, core_lifespan)
+
+    assert merged_app.router.lifespan_context is core_lifespan
+
+
 def test_merge_lifespans_rejects_startup_shutdown(user_app):
     """Test that merge_lifespans rejects deprecated startup/shutdown handlers"""
     user_app.router.on_startup = [lambda: None]
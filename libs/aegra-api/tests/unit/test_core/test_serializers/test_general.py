@@ -1,6 +1,11 @@
 """Unit tests for serializers"""
 
+import json
 from collections import namedtuple
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
@@ -206,6 +211,41 @@ class TestGeneralSerializer:
 
         assert result == {"items": [1, 2, 3], "metadata": {"key": "value"}}
 
+    def test_serialize_pydantic_model_json_mode(self) -> None:
+        """Pydantic fields come back as JSON primitives, unknown leaves via the fallback"""
+
+        class Opaque:
+            def __str__(self) -> str:
+                return "opaque"
+
+        class RichModel(BaseModel):
+            model_config = {"arbitrary_types_allowed": True}
+
+            at: datetime
+            tags: set[str]
+            extra: Opaque
+
+        model = RichModel(at=datetime(2024, 1, 2, tzinfo=UTC), tags={"a"}, extra=Opaque())
+        result = self.serializer.serialize(model)
+
+        assert result == {"at": "2024-01-02T00:00:00Z", "tags": ["a"], "extra": "opaque"}
+
+    def test_serialize_datetimes_match_inside_and_outside_models(self) -> None:
+        """Top-level datetimes use the same ISO format as datetimes nested in models"""
+
+        class Stamped(BaseModel):
+            at: datetime
+
+        naive = datetime(2024, 1, 1)
+        aware = datetime(2024, 1, 1, tzinfo=UTC)
+        result = self.serializer.serialize(
+            {"model": Stamped(at=naive), "at": naive, "aware_model": Stamped(at=aware), "aware": aware}
+        )
+
+        assert result["model"]["at"] == result["at"] == "2024-01-01T00:00:00"
+        assert result["aware_model"]["at"] == result["aware"] == "2024-01-01T00:00:00Z"
+        assert json.loads(self.serializer.serialize_json({"at": naive})) == {"at": "2024-01-01T00:00:00"}
+
     def test_serialize_mixed_types_in_list(self):
         """Test serialization of list with mixed types"""
         data = [1, "string", 3.14, True, None, {"key": "value"}, [1, 2]]
@@ -261,6 +301,105 @@ class TestGeneralSerializer:
         assert isinstance(result, str)
         assert "dict" in result
 
+    def test_handler_resolved_once_per_type(self) -> None:
+        """Duck-typing checks run for the first instance of a type only"""
+        models = [PydanticV2Model(name=str(i), value=i) for i in range(3)]
+
+        with patch.object(self.serializer, "_resolve_handler", wraps=self.serializer._resolve_handler) as resolve:
+            result = self.serializer.serialize(models)
+
+        assert result == [{"name": str(i), "value": i} for i in range(3)]
+        resolve.assert_called_once()
+
+
+class TestGeneralSerializerJson:
+    """Test GeneralSerializer.serialize_json byte output"""
+
+    def setup_method(self) -> None:
+        """Setup test fixtures"""
+        self.serializer = GeneralSerializer()
+
+    def _stdlib(self, obj: Any) -> bytes:
+        return json.dumps(obj, default=self.serializer.serialize, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def test_serialize_json_returns_compact_bytes(self) -> None:
+        """Test plain containers encode to compact UTF-8 JSON"""
+        result = self.serializer.serialize_json({"a": [1, "zwei", None], "ü": True})
+
+        assert result == '{"a":[1,"zwei",null],"ü":true}'.encode()
+
+    def test_serialize_json_pydantic_model_nested(self) -> None:
+        """Test models nested in containers go through the default hook"""
+        data = {"items": [PydanticV2Model(name="test", value=42)], "tags": frozenset(["x"])}
+
+        result = json.loads(self.serializer.serialize_json(data))
+
+        assert result == {"items": [{"name": "test", "value": 42}], "tags": ["x"]}
+
+    def test_serialize_json_matches_stdlib_for_namedtuple_and_datetime(self) -> None:
+        """Test NamedTuples stay arrays and datetimes go through serialize() like json.dumps"""
+        Task = namedtuple("Task", ["id", "name"])
+        data = {"task": Task(id=1, name="t"), "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC), 1: "int key"}
+
+        assert self.serializer.serialize_json(data) == self._stdlib(data)
+
+    def test_serialize_json_big_int_falls_back_to_stdlib(self) -> None:
+        """Test integers beyond 64 bits still encode"""
+        assert self.serializer.serialize_json({"n": 2**70}) == b'{"n":1180591620717411303424}'
+
+    def test_serialize_json_wraps_errors(self) -> None:
+        """Test failures in the default hook surface as SerializationError"""
+
+        class Broken:
+            def model_dump(self) -> dict[str, Any]:
+                raise ValueError("boom")
+
+        with pytest.raises(SerializationError):
+            self.serializer.serialize_json({"bad": Broken()})
+
+    def test_serialize_json_does_not_retry_failed_default(self) -> None:
+        """Test a failing model_dump is not run again by the stdlib fallback"""
+        calls: list[int] = []
+
+        class Broken:
+            def model_dump(self) -> dict[str, Any]:
+                calls.append(1)
+                raise ValueError("boom")
+
+        with pytest.raises(SerializationError):
+            self.serializer.serialize_json({"bad": Broken()})
+
+        assert len(calls) == 1
+
+    def test_serialize_json_escapes_lone_surrogates(self) -> None:
+        """Test strings orjson rejects as invalid UTF-8 still encode via the stdlib fallback"""
+        result = self.serializer.serialize_json({"text": "bad \ud83d"})
+
+        assert result == b'{"text":"bad \\ud83d"}'
+        assert json.loads(result) == {"text": "bad \ud83d"}
+
+    def test_serialize_json_fallback_errors_raise_serialization_error(self) -> None:
+        """Test failures in the stdlib fallback surface as SerializationError"""
+        data: dict[str, Any] = {}
+        data["self"] = data
+
+        with pytest.raises(SerializationError):
+            self.serializer.serialize_json(data)
+
+    def test_serialize_json_encodes_plain_enum_by_value(self) -> None:
+        """Test plain Enums encode by value, unlike json.dumps(default=serialize)"""
+
+        class Color(Enum):
+            RED = 1
+
+        assert self.serializer.serialize_json({"color": Color.RED}) == b'{"color":1}'
+
+    def test_serialize_json_encodes_non_finite_floats_as_null(self) -> None:
+        """Test NaN and Infinity encode as null, so the output stays valid JSON"""
+        result = self.serializer.serialize_json({"nan": float("nan"), "inf": float("inf")})
+
+        assert result == b'{"nan":null,"inf":null}'
+
 
 class MockTask:
     """Mock LangGraph task"""
@@ -302,6 +441,19 @@ class TestLangGraphSerializer:
 
         assert result == {"outer": {"inner": [1, 2, 3]}}
 
+    def test_serialize_big_int_round_trip(self) -> None:
+        """Test integers beyond 64 bits come back as exact ints"""
+        result = self.serializer.serialize({"n": 2**70})
+
+        assert result == {"n": 2**70}
+        assert isinstance(result["n"], int)
+
+    def test_serialize_lone_surrogate_round_trip(self) -> None:
+        """Test strings with lone surrogates survive serialization"""
+        result = self.serializer.serialize({"text": "bad \ud83d"})
+
+        assert result == {"text": "bad \ud83d"}
+
     def test_serialize_task_with_id_and_name(self):
         """Test serialization of proper task object"""
         task = MockTask(task_id="task-123", name="test_task", error=None, result={"data": "value"})
@@ -76,6 +76,7 @@ async def test_lifespan_calls_required_initialization():
         patch("aegra_api.main.db_manager") as mock_db_manager,
         patch("aegra_api.main.get_langgraph_service") as mock_get_langgraph_service,
         patch("aegra_api.main.setup_observability") as mock_setup_observability,
+        patch("aegra_api.main.get_auth_backend") as mock_get_auth_backend,
     ):
         # Setup mocks
         mock_db_manager.initialize = AsyncMock()
@@ -99,10 +100,60 @@ async def test_lifespan_calls_required_initialization():
         # Verify observability setup was called
         mock_setup_observability.assert_called_once()
 
+        # Verify the auth backend is warmed before serving
+        mock_get_auth_backend.assert_called()
+
         # Verify cleanup
         mock_db_manager.close.assert_called_once()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lifespan_cancels_auth_warmup_when_startup_fails() -> None:
+    """A failing startup must not leave the auth warmup task pending."""
+    import aegra_api.main as main_module
+
+    importlib.reload(main_module)
+
+    with (
+        patch("aegra_api.main.run_migrations_async", new_callable=AsyncMock),
+        patch("aegra_api.main.db_manager") as mock_db_manager,
+        patch("aegra_api.main.asyncio") as mock_asyncio,
+    ):
+        mock_db_manager.initialize = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError, match="db down"):
+            async with main_module.lifespan(MagicMock()):
+                pass
+
+    auth_warmup = mock_asyncio.create_task.return_value
+    auth_warmup.cancel.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_lifespan_aborts_when_configured_auth_fails_to_load() -> None:
+    """Startup fails instead of serving every request unauthenticated."""
+    import aegra_api.main as main_module
+
+    importlib.reload(main_module)
+
+    failed_backend = MagicMock(auth_path="./auth.py:auth", auth_instance=None)
+    with (
+        patch("aegra_api.main.run_migrations_async", new_callable=AsyncMock),
+        patch("aegra_api.main.db_manager") as mock_db_manager,
+        patch("aegra_api.main.get_langgraph_service") as mock_get_langgraph_service,
+        patch("aegra_api.main.setup_observability"),
+        patch("aegra_api.main.get_auth_backend", return_value=failed_backend),
+    ):
+        mock_db_manager.initialize = AsyncMock()
+        mock_get_langgraph_service.return_value.initialize = AsyncMock()
+
+        with pytest.raises(RuntimeError, match=r"\./auth\.py:auth"):
+            async with main_module.lifespan(MagicMock()):
+                pass
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_lifespan_skips_migrations_when_disabled(monkeypatch):
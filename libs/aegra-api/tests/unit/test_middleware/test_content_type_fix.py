@@ -264,3 +264,39 @@ async def test_does_not_touch_receive_or_send(
 
     # The original receive and send should be passed through directly
     mock_asgi_app.assert_called_once_with(scope, mock_receive, mock_send)
+
+
+@pytest.mark.asyncio
+async def test_rewrites_mixed_case_text_plain(
+    middleware: ContentTypeFixMiddleware,
+    mock_receive: AsyncMock,
+    mock_send: AsyncMock,
+) -> None:
+    """Content-Type matching is case-insensitive."""
+    scope: dict = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", b"Text/Plain; charset=UTF-8")],
+    }
+
+    await middleware(scope, mock_receive, mock_send)
+
+    assert _get_content_type(scope) == b"application/json"
+
+
+@pytest.mark.asyncio
+async def test_accepts_bytes_method(
+    middleware: ContentTypeFixMiddleware,
+    mock_receive: AsyncMock,
+    mock_send: AsyncMock,
+) -> None:
+    """Hand-built scopes with a bytes method are handled like str methods."""
+    scope: dict = {
+        "type": "http",
+        "method": b"POST",
+        "headers": [(b"content-type", b"text/plain")],
+    }
+
+    await middleware(scope, mock_receive, mock_send)
+
+    assert _get_content_type(scope) == b"application/json"
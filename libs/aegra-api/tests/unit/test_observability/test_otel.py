@@ -234,6 +234,26 @@ class TestOpenTelemetryProviderSetup:
             # for the good target → two calls total
             assert tracer_provider_instance.add_span_processor.call_count == 2
 
+    def test_setup_skips_provider_without_exporters(self, mock_deps: dict[str, MagicMock]) -> None:
+        """Test that no tracer provider is built when no target yields an exporter."""
+        empty_target = MagicMock(spec=BaseOtelTarget)
+        empty_target.get_exporter.return_value = None
+        empty_target.name = "Unconfigured"
+
+        provider = OpenTelemetryProvider()
+        provider._active_targets = [empty_target]
+        provider._enabled = True
+
+        provider.setup()
+        provider.setup()
+
+        mock_deps["tp"].assert_not_called()
+        mock_deps["resource"].create.assert_not_called()
+        mock_deps["trace"].set_tracer_provider.assert_not_called()
+        # Exporters are probed once, and the provider stays registrable
+        empty_target.get_exporter.assert_called_once()
+        assert provider.is_enabled() is True
+
     def test_setup_instruments_globally(self, mock_deps):
         """Test that global tracer and instrumentation are set."""
         mock_deps["settings"].observability.OTEL_CONSOLE_EXPORT = True